@@ -0,0 +1,100 @@
+import pygame
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from utils import load_image, load_sound
+from link_corpus import LinkCorpus
+
+class AssetManager:
+    def __init__(self):
+        self.futures = {}
+        self.load_times = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        # A single worker decodes upcoming assets in order while the current screen plays
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='asset-loader')
+
+    def load(self, key, loader):
+        # The first caller loads the asset on its own thread; later callers share its future
+        with self.lock:
+            future = self.futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.futures[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if owner:
+            start = time.perf_counter()
+            try:
+                future.set_result(loader())
+            except Exception as e:
+                future.set_exception(e)
+            self.load_times[key] = time.perf_counter() - start
+        return future
+
+    def prefetch(self, key, loader):
+        with self.lock:
+            if key in self.futures:
+                return
+        self.executor.submit(self.load, key, loader)
+
+    def image_loader(self, filename, size, alpha):
+        def loader():
+            image = load_image(filename, size)
+            # Match the display pixel format once so blits skip the per-pixel conversion
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+            return image
+        return loader
+
+    def image(self, filename, size=None, alpha=False):
+        return self.load(('image', filename, size), self.image_loader(filename, size, alpha)).result()
+
+    def sound(self, filename):
+        return self.load(('sound', filename), lambda: load_sound(filename)).result()
+
+    def corpus(self, filepath):
+        return self.load(('corpus', filepath), lambda: LinkCorpus(filepath)).result()
+
+    def prefetch_image(self, filename, size=None, alpha=False):
+        self.prefetch(('image', filename, size), self.image_loader(filename, size, alpha))
+
+    def prefetch_sound(self, filename):
+        self.prefetch(('sound', filename), lambda: load_sound(filename))
+
+    def prefetch_corpus(self, filepath):
+        self.prefetch(('corpus', filepath), lambda: LinkCorpus(filepath))
+
+    def loaded(self, kind):
+        with self.lock:
+            futures = [future for key, future in self.futures.items() if key[0] == kind]
+        return [future.result() for future in futures if future.done() and future.exception() is None]
+
+    def image_bytes(self):
+        return sum(image.get_bytesize() * image.get_width() * image.get_height() for image in self.loaded('image'))
+
+    def sound_bytes(self):
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            return 0
+        frequency, sample_format, channels = mixer
+        bytes_per_second = frequency * (abs(sample_format) // 8) * channels
+        return sum(int(sound.get_length() * bytes_per_second) for sound in self.loaded('sound') if sound is not None)
+
+    def stats(self):
+        return {
+            'images': len(self.loaded('image')),
+            'sounds': len(self.loaded('sound')),
+            'pending': sum(1 for future in list(self.futures.values()) if not future.done()),
+            'hits': self.hits,
+            'misses': self.misses,
+            'load_time': sum(self.load_times.values()),
+            'image_bytes': self.image_bytes(),
+            'sound_bytes': self.sound_bytes()
+        }
+
+assets = AssetManager()
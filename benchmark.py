@@ -0,0 +1,272 @@
+import os
+import sys
+import csv
+import json
+import time
+import random
+import logging
+import argparse
+import platform
+import shutil
+import tempfile
+import subprocess
+import pygame
+from game import Game
+from levels import Level1, Level2, FallingLinksRound
+from runtime import runtime, ScriptFinished
+from utils import WIDTH, HEIGHT, FPS, load_links_from_csv
+from link_corpus import LinkCorpus
+from layout import TextLayout
+from fonts import fonts
+from slides import SlideDeck
+from sfx import sfx, pre_init
+
+class CountingEvents:
+    # Counts event polls so loops that never tick still report a frame count
+    def __init__(self, events):
+        self.events = events
+        self.polls = 0
+
+    def get(self):
+        self.polls += 1
+        return self.events.get()
+
+    def wait(self, timeout):
+        return self.events.wait(timeout)
+
+def headless_game(script):
+    runtime.start_headless(script, seed=0)
+    runtime.events = CountingEvents(runtime.events)
+    pygame.init()
+    return Game()
+
+class FullRound(FallingLinksRound):
+    # Normal spawning never gets near a large cap before links fall off, so the store is topped up to it every frame
+    def __init__(self, level, max_links, render_fps=FPS):
+        super().__init__(level, max_links, render_fps)
+        self.fill_random = random.Random(0)
+        self.live = []
+
+    def update(self, dt):
+        super().update(dt)
+        while len(self.falling_links) < self.max_links:
+            link = self.level.corpus.sample(self.fill_random)
+            self.falling_links.spawn(link['text'], link['is_legit'], self.level.link_sprite(link['text']),
+                                     self.fill_random.randint(0, WIDTH - 200), self.fill_random.randint(0, HEIGHT - 50), self.simulated_time)
+        self.live.append(len(self.falling_links))
+
+def bench_falling_links(max_links, seconds=30):
+    game = headless_game([{'wait': seconds * 1000}])
+    level = Level1(game)
+    scene = FullRound(level, max_links)
+    start = time.perf_counter()
+    try:
+        game.run(scene)
+    except ScriptFinished:
+        pass
+    elapsed = time.perf_counter() - start
+    frames = game.clock.frames
+    return {
+        'max_links': max_links,
+        'peak_links': max(scene.live),
+        'mean_links': sum(scene.live) / len(scene.live),
+        'frames': frames,
+        'fps': frames / elapsed,
+        'ms_per_frame': elapsed * 1000 / frames
+    }
+
+def bench_scenario(lines, seconds=5):
+    game = headless_game([{'wait': (seconds + 10) * 1000}])
+    level = Level2(game)
+    scenario = {
+        'content': [f"Line {i}: please verify your account details at http://example-{i}.com" for i in range(lines)],
+        'is_legit': False,
+        'explanation': "Benchmark scenario."
+    }
+    start = time.perf_counter()
+    try:
+        game.run(level.play_scenario([scenario], "Is this email legitimate or phishing?", ["Legitimate", "Phishing"], time_limit=seconds))
+    except ScriptFinished:
+        pass
+    elapsed = time.perf_counter() - start
+    frames = game.events.polls
+    return {'lines': lines, 'frames': frames, 'ms_per_frame': elapsed * 1000 / frames}
+
+def bench_layout(words):
+    headless_game([])
+    rng = random.Random(0)
+    vocabulary = ["phishing", "email", "link", "secure", "https", "account", "password", "verify", "a", "the"]
+    text = ' '.join(rng.choice(vocabulary) for _ in range(words))
+    font = fonts.get(None, 32)
+    layout = TextLayout()
+
+    start = time.perf_counter()
+    layout.wrap(text, font, WIDTH - 100)
+    cold_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    layout.wrap(text, font, WIDTH - 200)
+    measured_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    layout.wrap(text, font, WIDTH - 100)
+    cached_elapsed = time.perf_counter() - start
+    return {
+        'words': words,
+        'cold_words_per_s': words / cold_elapsed,
+        'measured_words_per_s': words / measured_elapsed,
+        'cached_us': cached_elapsed * 1000000
+    }
+
+def bench_links_csv(rows):
+    rng = random.Random(0)
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', delete=False) as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['link', 'is_legit'])
+        for i in range(rows):
+            writer.writerow([f"https://www.site{i}.example.com/path/{rng.randint(0, 10 ** 9)}", rng.random() < 0.5])
+        filepath = csv_file.name
+    try:
+        start = time.perf_counter()
+        load_links_from_csv(filepath)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        LinkCorpus(filepath)
+        index_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        corpus = LinkCorpus(filepath)
+        open_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(10000):
+            corpus.sample(rng)
+        sample_elapsed = time.perf_counter() - start
+        del corpus
+    finally:
+        os.remove(filepath)
+        if os.path.exists(filepath + '.idx'):
+            os.remove(filepath + '.idx')
+    return {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_s': rows / elapsed,
+        'corpus_index_seconds': index_elapsed,
+        'corpus_open_seconds': open_elapsed,
+        'corpus_samples_per_s': 10000 / sample_elapsed
+    }
+
+def bench_slides(count):
+    game = headless_game([])
+    level = Level1(game)
+    slides = [(f"Slide {i + 1}", ' '.join(["Check the sender address and hover over links before you click."] * 5)) for i in range(count)]
+    cache_dir = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        for index in range(count):
+            level.draw_slide(game.screen, *slides[index])
+        draw_elapsed = time.perf_counter() - start
+
+        deck = SlideDeck(slides, level.draw_slide, 'benchmark', cache_dir)
+        start = time.perf_counter()
+        for index in range(count):
+            deck.surface(index)
+        compile_elapsed = time.perf_counter() - start
+
+        deck = SlideDeck(slides, level.draw_slide, 'benchmark', cache_dir)
+        start = time.perf_counter()
+        for index in range(count):
+            deck.surface(index)
+        disk_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for index in range(count):
+            game.screen.blit(deck.surface(index), (0, 0))
+        flip_elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(cache_dir)
+    return {
+        'slides': count,
+        'draw_ms': draw_elapsed * 1000 / count,
+        'compile_ms': compile_elapsed * 1000 / count,
+        'disk_ms': disk_elapsed * 1000 / count,
+        'flip_ms': flip_elapsed * 1000 / count
+    }
+
+def bench_sfx(clicks):
+    # Rapid link clicks 20 ms apart, as in Level1, through the reserved link channels
+    runtime.start_headless([], seed=0)
+    pre_init()
+    pygame.init()
+    game = Game()
+    start = time.perf_counter()
+    for i in range(clicks):
+        sfx.mark_input()
+        sfx.play('correct' if i % 2 else 'wrong', 'links')
+        game.clock.wait(20)
+    elapsed = time.perf_counter() - start
+    stats = sfx.stats()
+    stats['clicks'] = clicks
+    stats['us_per_click'] = elapsed * 1000000 / clicks
+    return stats
+
+def bench_cold_start():
+    # Wall time from launching the interpreter to the first home-screen frame
+    start = time.time()
+    output = subprocess.run([sys.executable, __file__, '--cold-start-child'], capture_output=True, text=True, check=True).stdout
+    first_frame = float(output.strip().splitlines()[-1])
+    return {'seconds': first_frame - start}
+
+def cold_start_child():
+    from profiler import profiler
+    import main
+
+    def present(dirty=None):
+        print(time.time(), flush=True)
+        os._exit(0)
+
+    profiler.present = present
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as script_file:
+        script_file.write('[]')
+    sys.argv = ['main.py', '--headless', script_file.name, '--log-level', 'ERROR']
+    main.main()
+
+BENCHMARKS = {
+    'falling_links': lambda: [bench_falling_links(n) for n in (5, 50, 200)],
+    'scenario': lambda: [bench_scenario(n) for n in (5, 50, 200)],
+    'layout': lambda: [bench_layout(n) for n in (1000, 10000)],
+    'links_csv': lambda: [bench_links_csv(100000)],
+    'slides': lambda: [bench_slides(20)],
+    'sfx': lambda: [bench_sfx(1000)],
+    'cold_start': lambda: [bench_cold_start()]
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless performance benchmarks for Fonolt")
+    parser.add_argument('--output', default='benchmark_results.json', help="file to write the JSON results to")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument('--cold-start-child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_start_child:
+        cold_start_child()
+        return
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    results = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'benchmarks': {}
+    }
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}")
+        results['benchmarks'][name] = BENCHMARKS[name]()
+        print(json.dumps(results['benchmarks'][name], indent=2))
+
+    with open(args.output, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
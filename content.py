@@ -0,0 +1,114 @@
+import os
+import json
+import pickle
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT = 'content'
+CACHE_DIR = '.cache'
+CACHE_VERSION = 2  # bumped when validation changes, so packs cached by older rules are checked again
+SCENARIO_OPTIONS = 2  # Level2 and Level3 lay out exactly two answer buttons
+
+# Keys ending in '?' are optional; [schema] is a list whose items all match schema
+SLIDE_SCHEMA = {'title': str, 'content': str}
+SCENARIO_SCHEMA = {'content': [str], 'is_legit': bool, 'explanation?': str}
+SCENARIO_LEVEL_SCHEMA = {
+    'instructions': [str],
+    'question': str,
+    'options': [str],
+    'legit_option?': int,  # index of the option that means "legitimate"; defaults to the first
+    'time_limit': int,
+    'pass_score?': int,
+    'scenarios': [SCENARIO_SCHEMA]
+}
+LEVEL_SCHEMAS = {
+    'intro': {'instructions': [str]},
+    'level1': {'instructions': [str], 'tutorial': [SLIDE_SCHEMA]},
+    'level2': SCENARIO_LEVEL_SCHEMA,
+    'level3': SCENARIO_LEVEL_SCHEMA
+}
+
+class ContentError(ValueError):
+    pass
+
+def validate_options(data, path):
+    options = data['options']
+    if len(options) != SCENARIO_OPTIONS:
+        raise ContentError(f"{path}.options: expected {SCENARIO_OPTIONS} options, one for each answer button")
+    if not 0 <= data.get('legit_option', 0) < len(options):
+        raise ContentError(f"{path}.legit_option: expected the index of one of the options")
+
+def validate(value, schema, path):
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise ContentError(f"{path}: expected an object")
+        keys = {key.rstrip('?'): key for key in schema}
+        for key in value:
+            if key not in keys:
+                raise ContentError(f"{path}: unknown field '{key}'")
+        for name, key in keys.items():
+            if name in value:
+                validate(value[name], schema[key], f"{path}.{name}")
+            elif not key.endswith('?'):
+                raise ContentError(f"{path}: missing field '{name}'")
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            raise ContentError(f"{path}: expected a list")
+        for i, item in enumerate(value):
+            validate(item, schema[0], f"{path}[{i}]")
+    elif schema is int:
+        # bool is a subclass of int, but true/false is never a valid number here
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ContentError(f"{path}: expected an integer")
+    elif not isinstance(value, schema):
+        raise ContentError(f"{path}: expected {schema.__name__}")
+
+class ContentPack:
+    def __init__(self, directory=DEFAULT_CONTENT):
+        self.directory = directory
+        self.levels = {}
+
+    def level(self, name):
+        # Each level's content is parsed on first use and kept for the rest of the session
+        if name not in self.levels:
+            self.levels[name] = self.load(name)
+        return self.levels[name]
+
+    def load(self, name):
+        source = os.path.join(self.directory, f"{name}.json")
+        cache = os.path.join(self.directory, CACHE_DIR, f"{name}.pickle")
+        try:
+            stat = os.stat(source)
+        except OSError:
+            raise ContentError(f"Content pack {self.directory} has no {name}.json")
+        stamp = (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+        try:
+            with open(cache, 'rb') as cache_file:
+                cached_stamp, data = pickle.load(cache_file)
+            if cached_stamp == stamp:
+                return data
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass
+
+        with open(source, encoding='utf-8') as source_file:
+            try:
+                data = json.load(source_file)
+            except json.JSONDecodeError as e:
+                raise ContentError(f"{source}: {e}")
+        validate(data, LEVEL_SCHEMAS[name], name)
+        if 'options' in data:
+            validate_options(data, name)
+
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            with open(cache, 'wb') as cache_file:
+                pickle.dump((stamp, data), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            logger.debug("Could not write content cache %s", cache)
+        return data
+
+    def validate_all(self):
+        for name in LEVEL_SCHEMAS:
+            self.level(name)
@@ -0,0 +1,119 @@
+import pygame
+
+class FallingLink:
+    __slots__ = ('serial', 'text', 'is_legit', 'surface', 'x', 'y', 'rect', 'cells', 'spawned')
+
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.cells = ()
+
+class SpatialGrid:
+    def __init__(self, cell_width, cell_height):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.cells = {}
+
+    def cells_for(self, rect):
+        columns = range(rect.left // self.cell_width, (rect.right - 1) // self.cell_width + 1)
+        rows = range(rect.top // self.cell_height, (rect.bottom - 1) // self.cell_height + 1)
+        return tuple((column, row) for column in columns for row in rows)
+
+    def insert(self, item, rect):
+        item.cells = self.cells_for(rect)
+        for cell in item.cells:
+            self.cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item):
+        for cell in item.cells:
+            bucket = self.cells[cell]
+            bucket.discard(item)
+            if not bucket:
+                del self.cells[cell]
+        item.cells = ()
+
+    def move(self, item, rect):
+        cells = self.cells_for(rect)
+        if cells != item.cells:
+            self.remove(item)
+            self.insert(item, rect)
+
+    def query(self, rect):
+        found = set()
+        for cell in self.cells_for(rect):
+            found.update(self.cells.get(cell, ()))
+        return found
+
+    def query_point(self, pos):
+        return self.cells.get((int(pos[0]) // self.cell_width, int(pos[1]) // self.cell_height), ())
+
+class FallingLinkStore:
+    def __init__(self, width, capacity=64, cell_width=200, cell_height=50):
+        self.width = width
+        self.free = [FallingLink() for _ in range(capacity)]
+        self.active = {}  # serial -> link, oldest first
+        self.grid = SpatialGrid(cell_width, cell_height)
+        self.next_serial = 0
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active.values())
+
+    def place(self, link):
+        link.rect.size = link.surface.get_size()
+        link.rect.center = (link.x, link.y)
+        if link.rect.left < 0:
+            link.rect.left = 0
+        elif link.rect.right > self.width:
+            link.rect.right = self.width
+
+    def spawn(self, text, is_legit, surface, x, y, spawned=0):
+        link = self.free.pop() if self.free else FallingLink()
+        link.serial = self.next_serial
+        self.next_serial += 1
+        link.text = text
+        link.is_legit = is_legit
+        link.surface = surface
+        link.x = x
+        link.y = y
+        link.spawned = spawned
+        self.place(link)
+        self.grid.insert(link, link.rect)
+        self.active[link.serial] = link
+        return link
+
+    def collides(self, x, y, dx=200, dy=50):
+        for link in self.grid.query(pygame.Rect(x - dx, y - dy, 2 * dx, 2 * dy)):
+            if abs(x - link.x) < dx and abs(y - link.y) < dy:
+                return True
+        return False
+
+    def move(self, dy):
+        # Links only fall, so the clamped x from spawn time stays valid
+        for link in self.active.values():
+            link.y += dy
+            link.rect.centery = link.y
+            self.grid.move(link, link.rect)
+
+    def draw(self, screen):
+        screen.blits([(link.surface, link.rect) for link in self.active.values()], doreturn=False)
+
+    def pick(self, pos):
+        # The oldest link under the cursor wins, as it did with the old list scan
+        hits = [link for link in self.grid.query_point(pos) if link.rect.collidepoint(pos)]
+        return min(hits, key=lambda link: link.serial) if hits else None
+
+    def release(self, link):
+        self.grid.remove(link)
+        del self.active[link.serial]
+        link.surface = None
+        self.free.append(link)
+
+    def prune(self, height):
+        # Every link falls at the same speed, so the oldest links are always the lowest
+        while self.active:
+            link = next(iter(self.active.values()))
+            if link.y < height:
+                break
+            self.release(link)
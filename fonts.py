@@ -0,0 +1,66 @@
+import os
+import json
+import logging
+import pygame
+
+logger = logging.getLogger(__name__)
+
+FONT_CACHE = os.path.join('.cache', 'fonts.json')
+
+class FontRegistry:
+    def __init__(self, cache_path=FONT_CACHE):
+        self.cache_path = cache_path
+        self.fonts = {}
+        self.paths = None  # system font name -> resolved file, loaded from cache_path on first lookup
+
+    def get(self, face, size):
+        # Same arguments as pygame.font.Font; each (face, size) is parsed once per session
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(face, size)
+        return font
+
+    def sysfont(self, name, size):
+        # Unknown names fall back to the default font, as SysFont does
+        return self.get(self.resolve(name), size)
+
+    def resolve(self, name):
+        if self.paths is None:
+            self.paths = self.load_paths()
+        if name in self.paths:
+            path = self.paths[name]
+            if path is None or os.path.exists(path):
+                return path  # None is a remembered miss: the default font, without scanning again
+        # match_font scans every installed font, so only do it once per machine, whether or not it finds one
+        path = pygame.font.match_font(name)
+        if path is None:
+            logger.debug("No system font matches %s; using the default font", name)
+        self.paths[name] = path
+        self.save_paths()
+        return path
+
+    def load_paths(self):
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, encoding='utf-8') as cache_file:
+                paths = json.load(cache_file)
+            if isinstance(paths, dict):
+                return paths
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def save_paths(self):
+        if self.cache_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(self.paths, cache_file, indent=2)
+        except OSError:
+            logger.debug("Could not write font cache %s", self.cache_path)
+
+# Shared by every screen and widget so equal fonts are the same object, which also keeps text_cache keys stable
+fonts = FontRegistry()
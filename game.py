@@ -1,130 +1,187 @@
 import pygame
-from utils import WIDTH, HEIGHT, FPS, COLOURS, load_image, load_sound
+import logging
+from utils import WIDTH, HEIGHT, COLOURS
+from assets import assets
 from levels import PhishingIntroduction, Level1, Level2, Level3, PhishingInfo
 from ui import Button
-
-class GameStateManager:
-    def __init__(self):
-        self.state = "HOME_SCREEN"
-
-    def set_state(self, new_state):
-        self.state = new_state
-
-    def get_state(self):
-        return self.state
+from text_cache import text_cache
+from fonts import fonts
+from screens import wait_for_buttons, wait_for_key, show_timed
+from scenes import as_scene
+from runtime import runtime, SessionQuit
+from profiler import profiler
+from content import ContentPack, DEFAULT_CONTENT
+from telemetry import telemetry, END, QUIT
+from music import music, HOME_MUSIC, INTRO_MUSIC
+from sfx import sfx
+
+logger = logging.getLogger(__name__)
+
+END_SCREEN_TIME = 5000  # ms the end screen stays up unless dismissed
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
 
 class Game:
-    def __init__(self):
-        print("Initialising game")
+    def __init__(self, content_dir=DEFAULT_CONTENT):
+        logger.info("Initialising game")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Fonolt")
-        self.clock = pygame.time.Clock()
+        self.clock = runtime.clock
+        self.events = runtime.events
+        self.random = runtime.random
         self.score = 0
         self.current_level = None
         self.current_level_number = 0
-        self.state_manager = GameStateManager()
+        self.slide_cache = None  # directory for rendered tutorial slides, set by --slide-cache
+        self.scenes = []
+        self.assets = assets
+        self.content = ContentPack(content_dir)
+        telemetry.start_session(runtime.seed)
         self.load_assets()
-        self.font = pygame.font.SysFont('Comic Sans MS', 36)
+        self.font = fonts.sysfont('Comic Sans MS', 36)
+        self.text_cache = text_cache
 
     def load_assets(self):
-        print("Loading assets")
-        self.background = load_image('background.png', (WIDTH, HEIGHT))
-        self.click_sound = load_sound('click.mp3')
-        self.correct_sound = load_sound('correct.mp3')
-        self.wrong_sound = load_sound('wrong.mp3')
-        self.home_music = load_sound('home_music.mp3')
-        self.intro_music = load_sound('level1music.mp3')
-
-    def run(self):
-        print("Running game")
-        while True:
-            if self.state_manager.get_state() == "HOME_SCREEN":
-                self.show_home_screen()
-            elif self.state_manager.get_state() == "PLAYING":
-                self.run_levels()
-            elif self.state_manager.get_state() == "END_SCREEN":
-                self.show_end_screen()
-                break
+        logger.info("Loading assets")
+        # Only the home screen's assets are loaded up front; the rest decode in the background
+        self.background = self.assets.image('background.png', (WIDTH, HEIGHT))
+        sfx.load(self.assets)
+        music.reset()
+        logger.info("Assets loaded: %s", self.assets.stats())
+
+    def run(self, scene=None):
+        # The only frame loop: every screen is a scene on this stack, and levels are flows that push them
+        logger.info("Running game")
+        self.scenes = [as_scene(scene if scene is not None else self.play())]
+        active = None
+        dt = 0
+        while self.scenes:
+            scene = self.scenes[-1]
+            music.update()
+            if scene is not active:
+                # A scene coming back to the top must redraw, and time spent under other scenes is not its frame time
+                active = scene
+                scene.invalidate()
+                dt = 0
+                if scene.frame_rate:
+                    self.clock.tick()
+
+            if not scene.done:
+                with profiler.section('update'):
+                    next_scene = scene.update(dt)
+                if next_scene is not None:
+                    self.scenes.append(next_scene)
+                    continue
+            if scene.done:
+                self.scenes.pop()
+                if not self.scenes:
+                    return scene.result
+                self.scenes[-1].resume(scene.result)
+                continue
+
+            if scene.dirty or scene.frame_rate:
+                with profiler.section('render'):
+                    dirty = scene.render(self.screen)
+                scene.dirty = False
+                profiler.present(dirty)
+                if scene.done:
+                    continue
+
+            with profiler.section('events'):
+                events = self.poll(scene)
+            if events:
+                sfx.mark_input()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.quit()
+                if event.type in REDRAW_EVENTS:
+                    scene.invalidate()
+                else:
+                    scene.handle_event(event)
+                if scene.done:
+                    break
+
+            if scene.frame_rate:
+                dt = self.clock.tick(scene.frame_rate)
+
+    def poll(self, scene):
+        if scene.frame_rate:
+            return self.events.get()
+        # Idle scenes sleep until something happens instead of spinning on event.get()
+        profiler.idle()
+        event = self.events.wait(min(scene.timeout(), music.timeout()))
+        return [] if event.type == pygame.NOEVENT else [event]
+
+    def quit(self):
+        telemetry.record(QUIT, 0, self.clock.get_ticks(), value=self.score)
+        if runtime.scripted:
+            raise SessionQuit()
+        pygame.quit()
+        quit()
+
+    def play(self):
+        yield self.show_home_screen()
+        yield self.run_levels()
+        telemetry.record(END, 0, self.clock.get_ticks(), value=self.score)
+        yield self.show_end_screen()
 
     def show_home_screen(self):
-        print("Showing home screen")
-        self.home_music.play(-1)  # Play home screen music
+        logger.info("Showing home screen")
+        music.play(HOME_MUSIC)
         startButton = Button("Start", WIDTH // 2 - 50, HEIGHT // 2, 100, 50)
         exitButton = Button("Exit", WIDTH // 2 - 50, HEIGHT // 2 + 70, 100, 50)
 
-        while self.state_manager.get_state() == "HOME_SCREEN":
-            self.screen.blit(self.background, (0, 0))
-            startButton.draw(self.screen)
-            exitButton.draw(self.screen)
-            pygame.display.flip()
+        def draw(screen):
+            screen.blit(self.background, (0, 0))
+            startButton.draw(screen)
+            exitButton.draw(screen)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    quit()
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if startButton.is_clicked(event.pos):
-                        print("Start button clicked")
-                        self.home_music.stop()
-                        self.intro_music.play(-1)  # Play intro music
-                        self.state_manager.set_state("PLAYING")
-                        return
-                    elif exitButton.is_clicked(event.pos):
-                        print("Exit button clicked")
-                        pygame.quit()
-                        quit()
-
-            self.clock.tick(FPS)
+        button = yield wait_for_buttons(draw, [startButton, exitButton])
+        if button is exitButton:
+            logger.info("Exit button clicked")
+            self.quit()
+        logger.info("Start button clicked")
+        music.play(INTRO_MUSIC)  # Fades the home music out first
 
     def run_levels(self):
-        print("Running levels")
-        levels = [
-            PhishingIntroduction(self),
-            Level1(self),
-            Level2(self),
-            Level3(self),
-        ]
-
-        for level in levels:
+        logger.info("Running levels")
+        level_classes = [PhishingIntroduction, Level1, Level2, Level3]
+
+        for i, level_class in enumerate(level_classes):
+            # Decode the next level's assets while this one plays
+            if i + 1 < len(level_classes):
+                level_classes[i + 1].prefetch(self.assets)
+            level = level_class(self)
             self.current_level = level
-            print(f"Running level: {level.__class__.__name__}")
-           # if isinstance(level, Level1):
-               # self.intro_music.stop()  # Stop intro music before Level1 starts
-            level_score = level.run()
+            profiler.set_level(level.__class__.__name__)
+            telemetry.set_level(i, self.clock.get_ticks())
+            logger.info("Running level: %s", level.__class__.__name__)
+            level_score = yield level.run()
             if level_score is not None:
                 self.score += level_score
             if not isinstance(level, PhishingIntroduction) and not isinstance(level, PhishingInfo):
-                self.show_level_complete()
+                yield self.show_level_complete()
                 self.current_level_number += 1  # Increment after showing level complete
 
-        self.state_manager.set_state("END_SCREEN")
-
     def show_end_screen(self):
-        print("Showing end screen")
-        self.screen.fill(COLOURS['WHITE'])
-        self.render_text("Congratulations!", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2 - 50))
-        self.render_text("You've successfully completed the Phishing Awareness Game.", COLOURS['BLACK'], (WIDTH // 2 - 300, HEIGHT // 2))
-        self.render_text("Well done for passing!", COLOURS['BLACK'], (WIDTH // 2 - 150, HEIGHT // 2 + 50))
-        pygame.display.flip()
-        pygame.time.wait(5000)
+        logger.info("Showing end screen")
+
+        def draw(screen):
+            screen.fill(COLOURS['WHITE'])
+            self.render_text("Congratulations!", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2 - 50))
+            self.render_text("You've successfully completed the Phishing Awareness Game.", COLOURS['BLACK'], (WIDTH // 2 - 300, HEIGHT // 2))
+            self.render_text("Well done for passing!", COLOURS['BLACK'], (WIDTH // 2 - 150, HEIGHT // 2 + 50))
+
+        return show_timed(draw, END_SCREEN_TIME)
 
     def render_text(self, text, color, position):
-        text_surface = self.font.render(text, True, color)
+        text_surface = self.text_cache.render(self.font, text, True, color)
         self.screen.blit(text_surface, position)
 
     def show_level_complete(self):
-        self.screen.fill(COLOURS['WHITE'])
-        self.render_text(f"Level {self.current_level_number + 1} Complete!", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2 - 50))
-        self.render_text(f"Current Score: {self.score}", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2))
-        self.render_text("Press any key to continue", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2 + 50))
-        pygame.display.flip()
-
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    quit()
-                if event.type == pygame.KEYUP:
-                    waiting = False
-            self.clock.tick(FPS)
\ No newline at end of file
+        def draw(screen):
+            screen.fill(COLOURS['WHITE'])
+            self.render_text(f"Level {self.current_level_number + 1} Complete!", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2 - 50))
+            self.render_text(f"Current Score: {self.score}", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2))
+            self.render_text("Press any key to continue", COLOURS['BLACK'], (WIDTH // 2 - 100, HEIGHT // 2 + 50))
+
+        return wait_for_key(draw)
\ No newline at end of file
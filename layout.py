@@ -0,0 +1,65 @@
+from collections import OrderedDict
+
+class TextLayout:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.word_widths = {}  # font -> {word: width}, each word is measured once per font
+        self.paragraphs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def widths_for(self, font):
+        widths = self.word_widths.get(font)
+        if widths is None:
+            widths = self.word_widths[font] = {' ': font.size(' ')[0]}
+        return widths
+
+    def wrap(self, text, font, max_width):
+        # Returns the lines of text that fit in max_width pixels; newlines always start a new line
+        key = (text, font, max_width)
+        lines = self.paragraphs.get(key)
+        if lines is not None:
+            self.hits += 1
+            self.paragraphs.move_to_end(key)
+            return lines
+
+        self.misses += 1
+        widths = self.widths_for(font)
+        space = widths[' ']
+        lines = []
+        for paragraph in text.split('\n'):
+            current_line = []
+            line_width = 0
+            for word in paragraph.split():
+                width = widths.get(word)
+                if width is None:
+                    width = widths[word] = font.size(word)[0]
+                if current_line and line_width + space + width > max_width:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    line_width = width
+                else:
+                    line_width += space + width if current_line else width
+                    current_line.append(word)
+            lines.append(' '.join(current_line))
+
+        lines = tuple(lines)
+        self.paragraphs[key] = lines
+        if len(self.paragraphs) > self.max_size:
+            self.paragraphs.popitem(last=False)
+        return lines
+
+    def render(self, text, font, max_width, color, text_cache):
+        # The laid-out lines as surfaces, rasterised through text_cache so repeats cost a lookup
+        return [text_cache.render(font, line, True, color) for line in self.wrap(text, font, max_width)]
+
+    def stats(self):
+        return {
+            'paragraphs': len(self.paragraphs),
+            'fonts': len(self.word_widths),
+            'words': sum(len(widths) for widths in self.word_widths.values()),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+text_layout = TextLayout()
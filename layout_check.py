@@ -0,0 +1,103 @@
+import os
+import time
+import multiprocessing
+import pygame
+from utils import WIDTH, HEIGHT
+from runtime import runtime
+from text_cache import text_cache
+from game import Game
+from levels import PhishingIntroduction, Level1, Level2, Level3
+
+LEVEL_CLASSES = {'intro': PhishingIntroduction, 'level1': Level1, 'level2': Level2, 'level3': Level3}
+
+class RecordingSurface(pygame.Surface):
+    # Remembers the full, unclipped rect of every blit so text that runs off the screen can be reported
+    def __init__(self, size):
+        super().__init__(size)
+        self.blitted = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        topleft = dest.topleft if isinstance(dest, pygame.Rect) else dest
+        self.blitted.append((source, pygame.Rect(topleft, area.size if area is not None else source.get_size())))
+        return super().blit(source, dest, area, special_flags)
+
+# Set up by the first task each worker runs
+game = None
+levels = {}
+
+def start_worker(content_dir):
+    # Run inside a task rather than as the pool initializer, so a failure reaches the parent instead of respawning workers
+    global game
+    if game is not None:
+        return
+    runtime.start_headless([])
+    pygame.init()
+    game = Game(content_dir)
+    game.screen = RecordingSurface((WIDTH, HEIGHT))
+
+def check_screen(level_name, screen_name, screen, buttons, elapsed):
+    texts = {id(surface): key[1] for key, surface in text_cache.surfaces.items()}
+    screen_rect = screen.get_rect()
+    overflow = []
+    overlap = []
+    for surface, rect in screen.blitted:
+        if rect.size == screen_rect.size:
+            continue  # Backgrounds and copies of the whole screen
+        text = texts.get(id(surface), f"{rect.width}x{rect.height} surface")
+        if not screen_rect.contains(rect):
+            overflow.append({'text': text, 'rect': list(rect)})
+        for button in buttons:
+            # A button's own label is centred on it; anything else touching the button is in the way
+            if rect.colliderect(button.rect) and rect.center != button.rect.center:
+                overlap.append({'text': text, 'rect': list(rect), 'button': button.text})
+    return {'level': level_name, 'screen': screen_name, 'ms': elapsed * 1000, 'overflow': overflow, 'overlap': overlap}
+
+def check_chunk(task):
+    # Each worker takes every chunks-th screen of a level, so long scenario lists spread across the pool
+    content_dir, level_name, chunk, chunks = task
+    start_worker(content_dir)
+    level = levels.get(level_name)
+    if level is None:
+        level = levels[level_name] = LEVEL_CLASSES[level_name](game)
+    screen = game.screen
+    results = []
+    for index, (screen_name, draw, buttons) in enumerate(level.screens(game.content.level(level_name))):
+        if index % chunks != chunk:
+            continue
+        screen.blitted.clear()
+        start = time.perf_counter()
+        draw(screen)
+        results.append(check_screen(level_name, screen_name, screen, buttons, time.perf_counter() - start))
+    return results
+
+def check_layout(content_dir, workers=None):
+    # Renders every screen of the content pack offscreen and prints what overflows or covers a button
+    workers = workers or os.cpu_count() or 1
+    tasks = [(content_dir, name, chunk, workers * 2) for name in LEVEL_CLASSES for chunk in range(workers * 2)]
+    results = []
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(workers)
+    try:
+        for chunk_results in pool.imap_unordered(check_chunk, tasks):
+            results.extend(chunk_results)
+    finally:
+        # SDL turns SIGTERM into a quit event in the workers, so they are let finish rather than terminated
+        pool.close()
+        pool.join()
+    elapsed = time.perf_counter() - start
+
+    problems = 0
+    for result in sorted(results, key=lambda result: (result['level'], result['screen'])):
+        for item in result['overflow']:
+            problems += 1
+            print(f"{result['level']} {result['screen']}: '{item['text']}' runs off the screen at {item['rect']}")
+        for item in result['overlap']:
+            problems += 1
+            print(f"{result['level']} {result['screen']}: '{item['text']}' overlaps the {item['button']} button at {item['rect']}")
+
+    if results:
+        slowest = max(results, key=lambda result: result['ms'])
+        mean = sum(result['ms'] for result in results) / len(results)
+        print(f"Checked {len(results)} screens with {workers} workers in {elapsed:.2f}s: "
+              f"{problems} problems, {mean:.2f}ms mean render, slowest {slowest['level']} {slowest['screen']} at {slowest['ms']:.2f}ms")
+    return problems
@@ -0,0 +1,108 @@
+import os
+import csv
+import mmap
+import array
+import struct
+import logging
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b'FLIX'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sBQQQQ')  # magic, version, source mtime_ns, source size, legit rows, phishing rows
+
+class LinkCorpus:
+    def __init__(self, filepath, index_path=None):
+        self.filepath = filepath
+        self.index_path = index_path or filepath + '.idx'
+        with open(filepath, 'rb') as csv_file:
+            self.data = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_end = self.data.find(b'\n')
+        self.columns = next(csv.reader([self.data[:header_end].decode('utf-8').strip()]))
+        self.link_column = self.columns.index('link')
+        self.legit_column = self.columns.index('is_legit')
+        self.legit, self.phishing = self.load_index()
+
+    def __len__(self):
+        return len(self.legit) + len(self.phishing)
+
+    def __iter__(self):
+        for offsets in (self.legit, self.phishing):
+            for offset in offsets:
+                yield self.read(offset)
+
+    def source_stamp(self):
+        stat = os.stat(self.filepath)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load_index(self):
+        # The index is memory-mapped too, so opening a corpus costs the same at any size
+        mtime, size = self.source_stamp()
+        try:
+            with open(self.index_path, 'rb') as index_file:
+                index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_mtime, index_size, legit_rows, phishing_rows = INDEX_HEADER.unpack_from(index, 0)
+            # A short or overlong file is a stale or interrupted write, whatever its header says
+            complete = len(index) == INDEX_HEADER.size + 8 * (legit_rows + phishing_rows)
+            if magic == INDEX_MAGIC and version == INDEX_VERSION and (index_mtime, index_size) == (mtime, size) and complete:
+                offsets = memoryview(index)[INDEX_HEADER.size:].cast('Q')
+                return offsets[:legit_rows], offsets[legit_rows:legit_rows + phishing_rows]
+        except (OSError, ValueError, struct.error):
+            pass
+        return self.build_index(mtime, size)
+
+    def build_index(self, mtime, size):
+        logger.info("Indexing link corpus %s", self.filepath)
+        legit = array.array('Q')
+        phishing = array.array('Q')
+        offset = self.data.find(b'\n') + 1
+        fast_path = self.legit_column == len(self.columns) - 1
+        while offset < len(self.data):
+            end = self.data.find(b'\n', offset)
+            if end == -1:
+                end = len(self.data)
+            line = self.data[offset:end].rstrip(b'\r')
+            if line:
+                if fast_path:
+                    is_legit = line.rsplit(b',', 1)[-1].strip().lower() == b'true'
+                else:
+                    is_legit = self.parse(line)[self.legit_column].lower() == 'true'
+                (legit if is_legit else phishing).append(offset)
+            offset = end + 1
+
+        # Written beside the index and renamed over it, so other processes only ever see a whole file
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as index_file:
+                index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, mtime, size, len(legit), len(phishing)))
+                legit.tofile(index_file)
+                phishing.tofile(index_file)
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            logger.warning("Could not write link index %s; keeping it in memory", self.index_path)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return legit, phishing
+
+    def parse(self, line):
+        return next(csv.reader([line.decode('utf-8')]))
+
+    def read(self, offset):
+        end = self.data.find(b'\n', offset)
+        row = self.parse(self.data[offset:end if end != -1 else len(self.data)].rstrip(b'\r'))
+        return {
+            'text': row[self.link_column],
+            'is_legit': row[self.legit_column].lower() == 'true'
+        }
+
+    def sample(self, rng, legit_ratio=None):
+        # Uniform over all rows by default; with legit_ratio, pick the partition first
+        if legit_ratio is None:
+            i = rng.randrange(len(self))
+            return self.read(self.legit[i] if i < len(self.legit) else self.phishing[i - len(self.legit)])
+        offsets = self.legit if rng.random() < legit_ratio else self.phishing
+        if not offsets:
+            offsets = self.legit or self.phishing
+        return self.read(offsets[rng.randrange(len(offsets))])
@@ -1,10 +1,96 @@
+import argparse
+import atexit
+import logging
 import pygame
 from game import Game
+from runtime import runtime, load_script, ScriptFinished, SessionQuit
+from replay import ReplayFinished
+from profiler import profiler
+from telemetry import telemetry
+from content import ContentPack, ContentError, DEFAULT_CONTENT
+from layout_check import check_layout
+from slides import SLIDE_CACHE
+from sfx import sfx, pre_init
+
+def run_headless(script, seed=None, content_dir=DEFAULT_CONTENT):
+    runtime.start_headless(script, seed)
+    pre_init()
+    pygame.init()
+    game = Game(content_dir)
+    try:
+        game.run()
+    except ScriptFinished:
+        logging.getLogger(__name__).info("Input script finished")
+    except SessionQuit:
+        logging.getLogger(__name__).info("Input script quit the session")
+    return game.score
+
+def seed_value(text):
+    # Session and telemetry logs store the seed as an unsigned 64-bit field
+    seed = int(text)
+    if not 0 <= seed < 2 ** 63:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {2 ** 63 - 1}")
+    return seed
 
 def main():
+    parser = argparse.ArgumentParser(description="Fonolt phishing awareness game")
+    parser.add_argument('--headless', metavar='SCRIPT', help="run without a window or audio device, driven by a JSON input script")
+    parser.add_argument('--sessions', type=int, default=1, help="number of headless sessions to run")
+    parser.add_argument('--seed', type=seed_value, help="random seed for headless sessions")
+    parser.add_argument('--record', metavar='LOG', help="record input, timing and the random seed to a session log")
+    parser.add_argument('--replay', metavar='LOG', help="replay a recorded session log as fast as possible")
+    parser.add_argument('--no-window', action='store_true', help="replay with the SDL dummy video and audio drivers")
+    parser.add_argument('--profile', metavar='FILE', nargs='?', const='profile.json', help="show the frame-time overlay and write per-level histograms to FILE on exit")
+    parser.add_argument('--telemetry', metavar='FILE', nargs='?', const='telemetry.log', help="append answers, reaction times and link clicks to FILE")
+    parser.add_argument('--content', default=DEFAULT_CONTENT, metavar='DIR', help="content pack directory with the scenarios, tutorials and instructions")
+    parser.add_argument('--check-content', action='store_true', help="validate the content pack, render every screen offscreen to check its layout, and exit")
+    parser.add_argument('--workers', type=int, help="processes to use for --check-content (default: one per CPU)")
+    parser.add_argument('--slide-cache', metavar='DIR', nargs='?', const=SLIDE_CACHE, help="keep rendered tutorial slides on disk in DIR between sessions")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help="minimum level of log messages to print")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+    if args.profile:
+        profiler.enable()
+        atexit.register(profiler.export, args.profile)
+        atexit.register(sfx.report)
+    if args.telemetry:
+        telemetry.start(args.telemetry)
+
+    if args.check_content:
+        try:
+            ContentPack(args.content).validate_all()
+        except ContentError as e:
+            parser.exit(1, f"Invalid content pack: {e}\n")
+        try:
+            problems = check_layout(args.content, args.workers)
+        except (OSError, pygame.error) as e:
+            parser.exit(1, f"Could not render content pack {args.content}: {e}\n")
+        if problems:
+            parser.exit(1, f"Content pack {args.content} has layout problems\n")
+        print(f"Content pack {args.content} is valid")
+        return
+
+    if args.headless:
+        script = load_script(args.headless)
+        for session in range(args.sessions):
+            score = run_headless(script, args.seed, args.content)
+            print(f"Session {session + 1}: score {score}")
+        return
+
+    if args.replay:
+        runtime.start_replay(args.replay, headless=args.no_window)
+    elif args.record:
+        runtime.start_recording(args.record)
+
+    pre_init()
     pygame.init()
-    game = Game()
-    game.run()
+    game = Game(args.content)
+    game.slide_cache = args.slide_cache
+    try:
+        game.run()
+    except ReplayFinished:
+        print(f"Replay finished with score {game.score}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,68 @@
+import logging
+import pygame
+from runtime import runtime
+from scenes import IDLE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+HOME_MUSIC = 'home_music.mp3'
+INTRO_MUSIC = 'level1music.mp3'
+LEVEL1_MUSIC = 'level1_music.mp3'
+FADE_OUT = 400  # ms to fade the old track out before the next one starts
+FADE_IN = 400  # ms the next track takes to fade in
+
+class MusicPlayer:
+    # Streams background tracks from disk through mixer.music, so only a small decode buffer is ever resident
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # Each game starts from silence; a new session's clock also starts again at 0
+        self.current = None
+        self.next = None  # (filename, loops) waiting for the current track to fade out
+        self.switch_at = None
+        if pygame.mixer.get_init() is not None:
+            pygame.mixer.music.stop()
+
+    def play(self, filename, loops=-1):
+        # Fades the current track out and the new one in; asking again for the track already playing does nothing
+        if self.next is not None:
+            if filename == self.next[0]:
+                return
+            self.next = (filename, loops)  # A newer request replaces the queued one, the fade keeps going
+            return
+        if filename == self.current:
+            return
+        if self.current is None:
+            self.start(filename, loops)
+            return
+        if pygame.mixer.get_init() is not None:
+            pygame.mixer.music.fadeout(FADE_OUT)
+        self.next = (filename, loops)
+        self.switch_at = runtime.clock.get_ticks() + FADE_OUT
+
+    def start(self, filename, loops):
+        self.current = filename
+        if pygame.mixer.get_init() is None:
+            return
+        try:
+            pygame.mixer.music.load(filename)
+            pygame.mixer.music.play(loops, fade_ms=FADE_IN)
+        except pygame.error:
+            logger.warning("Unable to play music: %s", filename)
+
+    def update(self):
+        # Called once per pass of the scene loop to start the queued track once the fade out is over
+        if self.next is not None and runtime.clock.get_ticks() >= self.switch_at:
+            filename, loops = self.next
+            self.next = None
+            self.start(filename, loops)
+
+    def timeout(self):
+        # How long an idle scene may sleep without starting the queued track late
+        if self.next is None:
+            return IDLE_TIMEOUT
+        return max(1, self.switch_at - runtime.clock.get_ticks())
+
+# mixer.music has a single stream, so there is only ever one player
+music = MusicPlayer()
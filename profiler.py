@@ -0,0 +1,136 @@
+import json
+import time
+import logging
+import pygame
+from collections import deque
+from text_cache import text_cache
+from assets import assets
+from fonts import fonts
+
+logger = logging.getLogger(__name__)
+
+OVERLAY_INTERVAL = 250  # ms between overlay refreshes
+HISTOGRAM_BUCKET = 1  # ms per histogram bucket
+HISTOGRAM_MAX = 100  # frames slower than this land in the last bucket
+
+class NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        sections = self.profiler.sections
+        sections[self.name] = sections.get(self.name, 0) + elapsed
+        return False
+
+NULL_SECTION = NullSection()
+
+class FrameProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.level = 'Game'
+        self.sections = {}
+        self.recent = deque(maxlen=600)
+        self.histograms = {}
+        self.totals = {}
+        self.last_frame = None
+        self.last_text_time = 0.0
+        self.overlay = None
+        self.overlay_rect = None
+        self.overlay_updated = 0
+        self.font = None
+
+    def enable(self):
+        self.enabled = True
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        return Section(self, name)
+
+    def set_level(self, name):
+        self.level = name
+        self.last_frame = None  # Do not count the time spent loading the level as a frame
+
+    def idle(self):
+        # Time spent waiting for input on a static screen is reading time, not a frame
+        self.last_frame = None
+
+    def present(self, dirty=None):
+        # Pushes the frame to the display; pass dirty rects to update only those regions
+        if not self.enabled:
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            return
+
+        overlay_rect = self.draw_overlay(pygame.display.get_surface())
+        with self.section('flip'):
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty or overlay_rect:
+                pygame.display.update(dirty + [overlay_rect] if overlay_rect else dirty)
+        self.end_frame()
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self.sections['text'] = text_cache.render_time - self.last_text_time
+        self.last_text_time = text_cache.render_time
+        if self.last_frame is not None:
+            frame_time = (now - self.last_frame) * 1000
+            self.recent.append(frame_time)
+            histogram = self.histograms.setdefault(self.level, [0] * (HISTOGRAM_MAX // HISTOGRAM_BUCKET + 1))
+            histogram[min(int(frame_time // HISTOGRAM_BUCKET), len(histogram) - 1)] += 1
+            totals = self.totals.setdefault(self.level, {})
+            for name, elapsed in self.sections.items():
+                totals[name] = totals.get(name, 0) + elapsed
+        self.sections = {}
+        self.last_frame = now
+
+    def percentile(self, fraction):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def draw_overlay(self, screen):
+        now = pygame.time.get_ticks()
+        if self.overlay is None or now - self.overlay_updated >= OVERLAY_INTERVAL:
+            if self.font is None:
+                self.font = fonts.get(None, 22)
+            p50 = self.percentile(0.5)
+            text = (f"FPS {1000 / p50 if p50 else 0:.0f}  p50 {p50:.1f}ms  p99 {self.percentile(0.99):.1f}ms  "
+                    f"text {text_cache.hit_rate():.0%}  assets {assets.hits}/{assets.hits + assets.misses}")
+            self.overlay = self.font.render(text, True, (255, 255, 0), (0, 0, 0))
+            self.overlay_updated = now
+        self.overlay_rect = screen.blit(self.overlay, (5, 5))
+        return self.overlay_rect
+
+    def export(self, filepath):
+        report = {}
+        for level, histogram in self.histograms.items():
+            frames = sum(histogram)
+            report[level] = {
+                'frames': frames,
+                'bucket_ms': HISTOGRAM_BUCKET,
+                'histogram': histogram,
+                'section_ms_per_frame': {name: total / frames for name, total in self.totals.get(level, {}).items()}
+            }
+        with open(filepath, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+        logger.info("Wrote frame profile to %s", filepath)
+
+profiler = FrameProfiler()
@@ -0,0 +1,156 @@
+import struct
+import pygame
+
+MAGIC = b'FNLT'
+VERSION = 1
+HEADER = struct.Struct('<4sBQ')
+VALUE = struct.Struct('<i')
+COUNT = struct.Struct('<H')
+EVENT = struct.Struct('<Hhhi')  # type, x, y, button or key
+
+TICK = b't'
+TICKS = b'g'
+POLL = b'e'
+WAIT = b'w'
+
+# Only events that change what the game does are kept; everything else replays as NOEVENT
+RECORDED_EVENTS = {
+    pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.KEYUP,
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED
+}
+
+class ReplayFinished(Exception):
+    pass
+
+class SessionWriter:
+    def __init__(self, filepath, seed):
+        self.file = open(filepath, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def value(self, tag, value):
+        self.file.write(tag + VALUE.pack(int(value)))
+
+    def events(self, events):
+        events = [event for event in events if event.type in RECORDED_EVENTS]
+        self.file.write(POLL + COUNT.pack(len(events)) + b''.join(pack_event(event) for event in events))
+
+    def event(self, event):
+        if event.type not in RECORDED_EVENTS:
+            event = pygame.event.Event(pygame.NOEVENT)
+        self.file.write(WAIT + pack_event(event))
+
+    def close(self):
+        self.file.close()
+
+class SessionReader:
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as log_file:
+            self.data = log_file.read()
+        magic, version, self.seed = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} session log: {filepath}")
+        self.offset = HEADER.size
+
+    def expect(self, tag):
+        if self.offset >= len(self.data):
+            raise ReplayFinished()
+        found = self.data[self.offset:self.offset + 1]
+        if found != tag:
+            raise ValueError(f"Replay out of sync at byte {self.offset}: expected {tag!r}, found {found!r}")
+        self.offset += 1
+
+    def value(self, tag):
+        self.expect(tag)
+        value, = VALUE.unpack_from(self.data, self.offset)
+        self.offset += VALUE.size
+        return value
+
+    def events(self):
+        self.expect(POLL)
+        count, = COUNT.unpack_from(self.data, self.offset)
+        self.offset += COUNT.size
+        return [self.read_event() for _ in range(count)]
+
+    def event(self):
+        self.expect(WAIT)
+        return self.read_event()
+
+    def read_event(self):
+        event_type, x, y, code = EVENT.unpack_from(self.data, self.offset)
+        self.offset += EVENT.size
+        return unpack_event(event_type, x, y, code)
+
+def pack_event(event):
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return EVENT.pack(event.type, event.pos[0], event.pos[1], event.button)
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        return EVENT.pack(event.type, 0, 0, event.key)
+    return EVENT.pack(event.type, 0, 0, 0)
+
+def unpack_event(event_type, x, y, code):
+    if event_type == pygame.MOUSEBUTTONDOWN:
+        return pygame.event.Event(event_type, pos=(x, y), button=code)
+    if event_type == pygame.KEYDOWN:
+        return pygame.event.Event(event_type, key=code, unicode='', mod=0)
+    if event_type == pygame.KEYUP:
+        return pygame.event.Event(event_type, key=code, mod=0)
+    return pygame.event.Event(event_type)
+
+class RecordingClock:
+    def __init__(self, clock, writer):
+        self.clock = clock
+        self.writer = writer
+
+    def tick(self, framerate=0):
+        dt = self.clock.tick(framerate)
+        self.writer.value(TICK, dt)
+        return dt
+
+    def get_ticks(self):
+        ticks = self.clock.get_ticks()
+        self.writer.value(TICKS, ticks)
+        return ticks
+
+    def wait(self, milliseconds):
+        self.clock.wait(milliseconds)
+
+class RecordingEvents:
+    def __init__(self, events, writer):
+        self.source = events
+        self.writer = writer
+
+    def get(self):
+        events = self.source.get()
+        self.writer.events(events)
+        return events
+
+    def wait(self, timeout):
+        event = self.source.wait(timeout)
+        self.writer.event(event)
+        return event
+
+class ReplayClock:
+    # Hands back the recorded readings without sleeping, so replays run faster than real time
+    def __init__(self, reader):
+        self.reader = reader
+
+    def tick(self, framerate=0):
+        return self.reader.value(TICK)
+
+    def get_ticks(self):
+        return self.reader.value(TICKS)
+
+    def wait(self, milliseconds):
+        pass
+
+class ReplayEvents:
+    def __init__(self, reader):
+        self.reader = reader
+
+    def get(self):
+        pygame.event.clear()  # Live input is ignored; the window only needs to stay responsive
+        return self.reader.events()
+
+    def wait(self, timeout):
+        pygame.event.clear()
+        return self.reader.event()
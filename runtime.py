@@ -0,0 +1,156 @@
+import os
+import json
+import atexit
+import random
+import pygame
+from collections import deque
+from utils import FPS
+from replay import SessionWriter, SessionReader, RecordingClock, RecordingEvents, ReplayClock, ReplayEvents
+
+class ScriptFinished(Exception):
+    pass
+
+class SessionQuit(Exception):
+    # A scripted quit ends only the current headless session, not the whole batch
+    pass
+
+class LiveClock:
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+
+    def tick(self, framerate=0):
+        return self.clock.tick(framerate)
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+    def wait(self, milliseconds):
+        pygame.time.wait(milliseconds)
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0
+        self.last_tick = 0
+        self.frames = 0
+
+    def tick(self, framerate=0):
+        # Never sleeps: each tick advances simulated time by one frame of the requested rate
+        self.now += 1000 / (framerate or FPS)
+        self.frames += 1
+        dt = int(self.now) - int(self.last_tick)  # Whole milliseconds that add up to the real elapsed time
+        self.last_tick = self.now
+        return dt
+
+    def get_ticks(self):
+        return int(self.now)
+
+    def wait(self, milliseconds):
+        self.now += milliseconds
+
+class LiveEvents:
+    def get(self):
+        return pygame.event.get()
+
+    def wait(self, timeout):
+        return pygame.event.wait(timeout)
+
+class ScriptedEvents:
+    def __init__(self, script, clock):
+        self.steps = deque(script)
+        self.clock = clock
+        self.pending = deque()
+        self.resume_at = 0
+        self.last_frame = -1
+
+    def next_event(self):
+        if self.pending:
+            return self.pending.popleft()
+        if self.clock.get_ticks() < self.resume_at:
+            return None
+        if not self.steps:
+            raise ScriptFinished()
+
+        step = self.steps.popleft()
+        if 'wait' in step:
+            self.resume_at = self.clock.get_ticks() + step['wait']
+            return None
+        events = make_events(step)
+        self.pending.extend(events[1:])
+        return events[0]
+
+    def get(self):
+        # Loops that poll without ticking still see time pass between polls
+        if self.clock.frames == self.last_frame:
+            self.clock.wait(1000 / FPS)
+        self.last_frame = self.clock.frames
+
+        event = self.next_event()
+        return [event] if event is not None else []
+
+    def wait(self, timeout):
+        event = self.next_event()
+        if event is None:
+            self.clock.wait(min(timeout, max(1, self.resume_at - self.clock.get_ticks())))
+            return pygame.event.Event(pygame.NOEVENT)
+        return event
+
+def make_events(step):
+    if 'click' in step:
+        x, y = step['click']
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1)]
+    if 'key' in step:
+        key = pygame.key.key_code(step['key'])
+        return [pygame.event.Event(pygame.KEYDOWN, key=key, unicode='', mod=0),
+                pygame.event.Event(pygame.KEYUP, key=key, mod=0)]
+    if 'quit' in step:
+        return [pygame.event.Event(pygame.QUIT)]
+    raise ValueError(f"Unknown script step: {step}")
+
+def load_script(filepath):
+    with open(filepath) as script_file:
+        return json.load(script_file)
+
+class Runtime:
+    def __init__(self):
+        self.clock = LiveClock()
+        self.events = LiveEvents()
+        self.random = random.Random()
+        self.seed_random()
+        self.headless = False
+        self.scripted = False
+        self.recorder = None
+
+    def seed_random(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.random.seed(seed)
+
+    def use_dummy_drivers(self):
+        # The dummy drivers must be selected before pygame.init() opens the display and mixer
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        self.headless = True
+
+    def start_headless(self, script, seed=None):
+        self.use_dummy_drivers()
+        self.clock = VirtualClock()
+        self.events = ScriptedEvents(script, self.clock)
+        self.scripted = True
+        self.seed_random(seed)
+
+    def start_recording(self, filepath):
+        self.recorder = SessionWriter(filepath, self.seed)
+        atexit.register(self.recorder.close)
+        self.clock = RecordingClock(self.clock, self.recorder)
+        self.events = RecordingEvents(self.events, self.recorder)
+
+    def start_replay(self, filepath, headless=False):
+        reader = SessionReader(filepath)
+        if headless:
+            self.use_dummy_drivers()
+        self.seed_random(reader.seed)
+        self.clock = ReplayClock(reader)
+        self.events = ReplayEvents(reader)
+
+runtime = Runtime()
@@ -0,0 +1,169 @@
+import pygame
+import logging
+from utils import WIDTH, HEIGHT, FPS, COLOURS
+from ui import Button
+from screens import RetainedScreen
+from scenes import Scene
+from telemetry import telemetry, ANSWER, TIMEOUT
+from sfx import sfx
+
+logger = logging.getLogger(__name__)
+
+class ScenarioLayout:
+    # Levels only differ in where things go and how feedback looks, so that is all they configure
+    def __init__(self, background, font, draw_feedback, question_font=None, colour=COLOURS['WHITE'],
+                 content_pos=(50, 50), line_height=30, question_pos=None, score_pos=(WIDTH - 150, 50),
+                 timer_pos=(WIDTH - 150, 20), button_rects=None, feedback_time=2000):
+        self.background = background
+        self.font = font
+        self.draw_feedback = draw_feedback
+        self.question_font = question_font or font
+        self.colour = colour
+        self.content_pos = content_pos
+        self.line_height = line_height
+        self.question_pos = question_pos  # None places the question under the email content
+        self.score_pos = score_pos
+        self.timer_pos = timer_pos
+        self.button_rects = button_rects
+        self.feedback_time = feedback_time
+
+    def buttons(self, options):
+        rects = self.button_rects or [(50 + i * 150, HEIGHT - 100, 100, 50) for i in range(len(options))]
+        if len(rects) != len(options):
+            raise ValueError(f"Layout has {len(rects)} answer buttons for {len(options)} options")
+        return [Button(option, *rect) for option, rect in zip(options, rects)]
+
+class ScenarioEngine(Scene):
+    def __init__(self, game, layout, scenarios, question, options, time_limit, legit_option=0, frame_rate=FPS):
+        super().__init__()
+        self.game = game
+        self.layout = layout
+        self.scenarios = scenarios
+        self.question = question
+        self.options = options
+        self.legit_option = legit_option  # Options are free text in any language, so answers are scored by position
+        self.time_limit = time_limit
+        self.frame_rate = frame_rate
+        self.buttons = layout.buttons(options)
+        self.score = 0
+        self.index = 0
+        self.start_time = None
+        self.retained = None
+        self.remaining_time = time_limit
+        self.feedback = None  # (result, explanation) while the feedback for this scenario is showing
+        self.feedback_until = None
+        self.feedback_shown = False
+        logger.info("Playing scenario")
+        if not scenarios:
+            self.close(self.score)  # Nothing to ask; finish before anything tries to draw scenario 0
+
+    @property
+    def scenario(self):
+        return self.scenarios[self.index]
+
+    def render_text(self, screen, text, font, position):
+        screen.blit(self.game.text_cache.render(font, text, True, self.layout.colour), position)
+
+    def compose(self, screen):
+        # Everything except the timer is drawn once per scenario and kept as the static layer
+        self.draw_static(screen)
+        return RetainedScreen(screen)
+
+    def draw_static(self, screen):
+        layout = self.layout
+        screen.blit(layout.background, (0, 0))
+        x, y = layout.content_pos
+        for line in self.scenario['content']:
+            self.render_text(screen, line, layout.font, (x, y))
+            y += layout.line_height
+        self.render_text(screen, self.question, layout.question_font, layout.question_pos or (x, y + 20))
+        self.render_text(screen, f"Score: {self.score}/{len(self.scenarios)}", layout.font, layout.score_pos)
+        for button in self.buttons:
+            button.draw(screen)
+
+    def timer_surface(self):
+        return self.game.text_cache.render(self.layout.font, f"Time left: {int(self.remaining_time)}s", True, self.layout.colour)
+
+    def screens(self):
+        # Every scenario and its feedback as (name, draw, buttons), for the layout checker
+        for index, scenario in enumerate(self.scenarios):
+            def draw_scenario(screen, index=index):
+                self.index = index
+                self.draw_static(screen)
+                screen.blit(self.timer_surface(), self.layout.timer_pos)
+
+            def draw_feedback(screen, scenario=scenario):
+                self.layout.draw_feedback(screen, "Incorrect", scenario.get('explanation', 'No explanation provided.'))
+
+            yield f"scenario {index + 1}", draw_scenario, self.buttons
+            yield f"feedback {index + 1}", draw_feedback, []
+
+    def clicked(self, pos):
+        for choice, button in enumerate(self.buttons):
+            if button.is_clicked(pos):
+                return choice
+        return None
+
+    def answer(self, choice):
+        result = "Correct" if self.scenario['is_legit'] == (choice == self.legit_option) else "Incorrect"
+        logger.debug("Button clicked: %s, Result: %s", self.options[choice], result)
+        if result == "Correct":
+            self.score += 1
+            sfx.play('correct')
+        else:
+            sfx.play('wrong')
+        now = self.game.clock.get_ticks()
+        telemetry.record(ANSWER, self.index, now, choice=choice, correct=result == "Correct",
+                         latency=now - self.start_time, value=self.score)
+        return result
+
+    def show_feedback(self, result):
+        explanation = self.scenario.get('explanation', 'No explanation provided.')
+        logger.debug("Showing feedback: %s, Explanation: %s", result, explanation)
+        self.feedback = (result, explanation)
+        self.feedback_until = self.game.clock.get_ticks() + self.layout.feedback_time
+        self.feedback_shown = False
+
+    def next_scenario(self, now):
+        self.index += 1
+        self.start_time = now
+        self.retained = None
+        self.feedback = None
+        if self.index == len(self.scenarios):
+            self.close(self.score)
+
+    def update(self, dt):
+        now = self.game.clock.get_ticks()
+        if self.start_time is None:
+            self.start_time = now
+        if self.feedback is None:
+            self.remaining_time = max(0, self.time_limit - (now - self.start_time) / 1000)
+            if self.remaining_time <= 0:
+                logger.debug("Time's up")
+                telemetry.record(TIMEOUT, self.index, now, latency=now - self.start_time, value=self.score)
+                self.show_feedback("Time's up")
+        elif now >= self.feedback_until:
+            self.next_scenario(now)
+
+    def handle_event(self, event):
+        if self.feedback is not None:
+            # A click or key press moves on early, but only once the feedback has actually been seen
+            if self.feedback_shown and event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYUP):
+                self.feedback_until = 0
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            choice = self.clicked(event.pos)
+            if choice is not None:
+                self.show_feedback(self.answer(choice))
+
+    def render(self, screen):
+        if self.feedback is not None:
+            if self.feedback_shown and not self.dirty:
+                return []
+            self.layout.draw_feedback(screen, *self.feedback)
+            self.feedback_shown = True
+            return None
+        if self.retained is None or self.dirty:
+            self.retained = self.compose(screen)
+        # Only the timer changes while a scenario is on screen
+        self.retained.blit('timer', self.timer_surface(), self.layout.timer_pos)
+        return self.retained.flush()
@@ -0,0 +1,64 @@
+import types
+from utils import FPS
+
+IDLE_TIMEOUT = 250  # ms to block waiting for input before checking an idle scene again
+
+class Scene:
+    # Scenes with a frame_rate are redrawn every frame; None redraws only when invalidated and sleeps until input
+    frame_rate = FPS
+
+    def __init__(self):
+        self.dirty = True
+        self.done = False
+        self.result = None
+
+    def invalidate(self):
+        self.dirty = True
+
+    def close(self, result=None):
+        self.done = True
+        self.result = result
+
+    def timeout(self):
+        return IDLE_TIMEOUT
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        # Returning a scene pushes it on top of this one; dt is 0 for idle scenes
+        return None
+
+    def render(self, screen):
+        # Returns the dirty rects to push to the display, or None for the whole screen
+        return None
+
+    def resume(self, result):
+        # Called with the result of the scene that was pushed on top of this one
+        pass
+
+class Flow(Scene):
+    # Runs a generator that yields scenes; each yielded scene is pushed and its result is sent back in
+    frame_rate = None
+
+    def __init__(self, steps):
+        super().__init__()
+        self.steps = steps
+        self.value = None
+
+    def resume(self, result):
+        self.value = result
+
+    def update(self, dt):
+        try:
+            scene = self.steps.send(self.value)
+            while scene is None:
+                scene = self.steps.send(None)
+        except StopIteration as stop:
+            self.close(stop.value)
+            return None
+        self.value = None
+        return as_scene(scene)
+
+def as_scene(scene):
+    return Flow(scene) if isinstance(scene, types.GeneratorType) else scene
@@ -0,0 +1,165 @@
+import pygame
+from runtime import runtime
+from scenes import Scene, IDLE_TIMEOUT
+
+DISMISS_DELAY = 300  # ms a timed screen ignores input for, so clicks already on their way don't dismiss it unread
+
+class ModalScreen(Scene):
+    frame_rate = None
+
+    def __init__(self, draw, on_click=None, on_key=None, duration=None, input_delay=0):
+        super().__init__()
+        self.draw = draw
+        self.on_click = on_click
+        self.on_key = on_key
+        self.duration = duration  # ms before the screen closes itself; None waits for input
+        self.deadline = None
+        self.input_delay = input_delay  # ms after it is first drawn before input counts
+        self.shown_at = None
+
+    def remaining(self):
+        if self.deadline is None:
+            self.deadline = runtime.clock.get_ticks() + self.duration
+        return self.deadline - runtime.clock.get_ticks()
+
+    def timeout(self):
+        if self.duration is None:
+            return IDLE_TIMEOUT
+        return max(1, min(IDLE_TIMEOUT, self.remaining()))
+
+    def update(self, dt):
+        if self.duration is not None and self.remaining() <= 0:
+            self.close()
+
+    def render(self, screen):
+        self.draw(screen)
+        if self.input_delay and self.shown_at is None:
+            self.shown_at = runtime.clock.get_ticks()
+        return None
+
+    def handle_event(self, event):
+        if self.input_delay and (self.shown_at is None or runtime.clock.get_ticks() - self.shown_at < self.input_delay):
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and self.on_click:
+            self.on_click(self, event.pos)
+        elif event.type == pygame.KEYUP and self.on_key:
+            self.on_key(self, event)
+
+def wait_for_buttons(draw, buttons):
+    def on_click(modal, pos):
+        for button in buttons:
+            if button.is_clicked(pos):
+                modal.close(button)
+                return
+
+    return ModalScreen(draw, on_click=on_click)
+
+def wait_for_key(draw):
+    return ModalScreen(draw, on_key=lambda modal, event: modal.close(event.key))
+
+def show_timed(draw, duration):
+    # Stays up for duration ms unless a click or key press dismisses it first
+    return ModalScreen(draw, on_click=lambda modal, pos: modal.close(), on_key=lambda modal, event: modal.close(),
+                       duration=duration, input_delay=DISMISS_DELAY)
+
+class TypewriterScreen(Scene):
+    def __init__(self, background, typewriter):
+        super().__init__()
+        self.background = background
+        self.typewriter = typewriter
+        self.dt = 0
+        self.skipping = False
+
+    def handle_event(self, event):
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.skipping = True  # Click or key press shows the full text
+
+    def update(self, dt):
+        self.dt += dt
+
+    def render(self, screen):
+        if self.dirty:
+            # An expose event or the first frame redraws the background and whatever text has been revealed
+            screen.blit(self.background, (0, 0))
+            self.typewriter.redraw(screen)
+            return None
+        dirty = self.typewriter.skip(screen) if self.skipping else self.typewriter.update(screen, self.dt)
+        self.dt = 0
+        if self.typewriter.finished:
+            self.close()  # Input after the last character belongs to whatever comes next
+        return dirty
+
+class SlideShow(Scene):
+    # Pages through a SlideDeck with Next and Previous; closes after Next on the last slide
+    frame_rate = None
+
+    def __init__(self, deck, next_button, prev_button, on_turn=None):
+        super().__init__()
+        self.deck = deck
+        self.next_button = next_button
+        self.prev_button = prev_button
+        self.on_turn = on_turn
+        self.current = 0
+        if len(deck) == 0:
+            self.close()  # An empty tutorial goes straight to whatever follows
+
+    def timeout(self):
+        # Wake straight away while neighbours are still to be compiled, then sleep as usual
+        return 1 if self.deck.pending(self.current) else IDLE_TIMEOUT
+
+    def update(self, dt):
+        if not self.dirty:
+            self.deck.prefetch(self.current)  # Only once the current slide is on screen
+
+    def handle_event(self, event):
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        if self.next_button.is_clicked(event.pos):
+            self.current += 1
+        elif self.current > 0 and self.prev_button.is_clicked(event.pos):
+            self.current -= 1
+        else:
+            return
+        if self.on_turn:
+            self.on_turn()
+        if self.current < len(self.deck):
+            self.invalidate()
+        else:
+            self.close()
+
+    def render(self, screen):
+        screen.blit(self.deck.surface(self.current), (0, 0))
+        self.next_button.draw(screen)
+        if self.current > 0:
+            self.prev_button.draw(screen)
+        return None
+
+class RetainedScreen:
+    def __init__(self, screen):
+        # Whatever is on the screen now becomes the static layer; only changed regions are pushed after this
+        self.screen = screen
+        self.static = screen.copy()
+        self.items = {}
+        self.dirty = None  # None until the static layer itself has been presented
+
+    def blit(self, key, surface, position):
+        previous = self.items.get(key)
+        if previous is not None and previous[0] is surface and previous[1].topleft == tuple(position):
+            return
+        rect = surface.get_rect(topleft=position)
+        if previous is not None:
+            self.screen.blit(self.static, previous[1], previous[1])  # Erase the old content
+            self.track(previous[1])
+        self.screen.blit(surface, rect)
+        self.track(rect)
+        self.items[key] = (surface, rect)
+
+    def track(self, rect):
+        if self.dirty is not None:
+            self.dirty.append(rect)
+
+    def flush(self):
+        # The dirty rects since the last flush; the first flush presents the whole screen
+        dirty = self.dirty
+        self.dirty = []
+        return dirty
@@ -0,0 +1,107 @@
+import time
+import logging
+import pygame
+from collections import deque
+from runtime import runtime
+
+logger = logging.getLogger(__name__)
+
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 256  # samples per device buffer; about 6 ms at 44.1 kHz, half of pygame's default
+CATEGORY_CHANNELS = {'ui': 1, 'feedback': 2, 'links': 4}  # reserved channels per category, the rest stay free
+EFFECTS = {
+    'click': ('click.mp3', 'ui'),
+    'correct': ('correct.mp3', 'feedback'),
+    'wrong': ('wrong.mp3', 'feedback')
+}
+MIN_INTERVAL = 40  # ms before the same effect can retrigger in the same category
+
+def pre_init():
+    # Must run before pygame.init() opens the mixer, otherwise the default buffer is used
+    pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
+
+class SoundEffects:
+    def __init__(self):
+        self.assets = None
+        self.channels = {}
+        self.started = {}  # channel -> tick its current effect started, for picking which voice to steal
+        self.last_played = {}
+        self.input_at = None
+        self.plays = 0
+        self.limited = 0
+        self.stolen = 0
+        self.dispatch = deque(maxlen=600)  # ms from input to play for recent effects
+
+    def load(self, assets):
+        # Effects decode on the asset loader into the mixer's own sample format, so playing one is a plain copy
+        self.assets = assets
+        for filename, _ in EFFECTS.values():
+            assets.prefetch_sound(filename)
+        self.channels = {}
+        self.started = {}
+        self.last_played = {}  # Each session's clock starts again at 0
+        if pygame.mixer.get_init() is None:
+            return
+        reserved = sum(CATEGORY_CHANNELS.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + 2))
+        pygame.mixer.set_reserved(reserved)  # Sound.play() elsewhere can never take these
+        first = 0
+        for category, count in CATEGORY_CHANNELS.items():
+            self.channels[category] = [pygame.mixer.Channel(first + i) for i in range(count)]
+            first += count
+
+    def mark_input(self):
+        # The scene loop calls this as each batch of events arrives, so dispatch latency runs from there
+        self.input_at = time.perf_counter()
+
+    def play(self, name, category=None):
+        filename, default_category = EFFECTS[name]
+        category = category or default_category
+        now = runtime.clock.get_ticks()
+        key = (name, category)
+        last = self.last_played.get(key)
+        if last is not None and 0 <= now - last < MIN_INTERVAL:
+            self.limited += 1  # Rapid clicks would only stack the same sound on itself
+            return
+        self.last_played[key] = now
+        channels = self.channels.get(category)
+        if not channels:
+            return
+        sound = self.assets.sound(filename)
+        if sound is None:
+            return
+
+        channel = next((channel for channel in channels if not channel.get_busy()), None)
+        if channel is None:
+            channel = min(channels, key=lambda channel: self.started.get(channel, 0))  # Steal the oldest voice
+            self.stolen += 1
+        channel.play(sound)
+        self.started[channel] = now
+        self.plays += 1
+        if self.input_at is not None:
+            self.dispatch.append((time.perf_counter() - self.input_at) * 1000)
+
+    def buffer_ms(self):
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            return 0.0
+        return MIXER_BUFFER * 1000 / mixer[0]
+
+    def stats(self):
+        dispatch = sorted(self.dispatch)
+        return {
+            'plays': self.plays,
+            'rate_limited': self.limited,
+            'stolen': self.stolen,
+            'buffer_ms': self.buffer_ms(),
+            'dispatch_ms_p50': dispatch[len(dispatch) // 2] if dispatch else 0.0,
+            'dispatch_ms_max': dispatch[-1] if dispatch else 0.0
+        }
+
+    def report(self):
+        # Input to sound is roughly the dispatch time plus one or two device buffers
+        logger.info("Sound effects: %s", self.stats())
+
+sfx = SoundEffects()
@@ -0,0 +1,83 @@
+import os
+import json
+import hashlib
+import logging
+import pygame
+from utils import WIDTH, HEIGHT
+
+logger = logging.getLogger(__name__)
+
+SLIDE_CACHE = os.path.join('.cache', 'slides')  # used by --slide-cache when no directory is given
+
+def file_stamp(path):
+    # Goes into a deck's style so cached slides are redrawn when an image they are drawn on changes
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return [path, None, None]
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+class SlideDeck:
+    def __init__(self, slides, draw, style, cache_dir=None):
+        # draw(surface, *slide) paints one slide; style names everything else that changes its pixels (fonts, background)
+        self.slides = slides
+        self.draw = draw
+        self.style = style
+        self.cache_dir = cache_dir  # None keeps compiled slides in memory only
+        self.surfaces = [None] * len(slides)
+        self.rendered = 0
+        self.loaded = 0
+
+    def __len__(self):
+        return len(self.slides)
+
+    def surface(self, index):
+        # Each slide is compiled to a full-screen surface on first use, so turning a page is a single blit
+        surface = self.surfaces[index]
+        if surface is None:
+            surface = self.surfaces[index] = self.compile(index)
+        return surface
+
+    def pending(self, index):
+        return [neighbour for neighbour in (index + 1, index - 1)
+                if 0 <= neighbour < len(self.slides) and self.surfaces[neighbour] is None]
+
+    def prefetch(self, index):
+        # Compiles one neighbour of index per call so idle time is spent in small steps
+        pending = self.pending(index)
+        if pending:
+            self.surface(pending[0])
+
+    def key(self, index):
+        source = [self.slides[index], self.style, WIDTH, HEIGHT, pygame.version.ver, pygame.font.get_default_font()]
+        return hashlib.sha1(json.dumps(source).encode('utf-8')).hexdigest()
+
+    def compile(self, index):
+        path = os.path.join(self.cache_dir, f"{self.key(index)}.png") if self.cache_dir else None
+        if path is not None:
+            try:
+                surface = pygame.image.load(path)
+                self.loaded += 1
+                return self.convert(surface)
+            except (OSError, pygame.error):
+                pass
+
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        self.draw(surface, *self.slides[index])
+        self.rendered += 1
+        if path is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                pygame.image.save(surface, path)
+            except (OSError, pygame.error):
+                logger.debug("Could not write slide cache %s", path)
+        return self.convert(surface)
+
+    def convert(self, surface):
+        if pygame.display.get_surface() is not None:
+            return surface.convert()
+        return surface
+
+    def stats(self):
+        return {'slides': len(self.slides), 'rendered': self.rendered, 'loaded': self.loaded,
+                'compiled': sum(surface is not None for surface in self.surfaces)}
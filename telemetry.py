@@ -0,0 +1,174 @@
+import sys
+import time
+import atexit
+import struct
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+SESSION_MAGIC = b'FNTS'
+VERSION = 1
+SESSION = struct.Struct('<4sBQQ')  # magic, version, wall clock start in ms, random seed
+RECORD = struct.Struct('<BBHIbbIi')  # kind, level, item, at ms, choice, correct, latency ms, value
+
+LEVEL = 1  # item: level number
+ANSWER = 2  # item: scenario index, choice: option index, value: score after answering
+TIMEOUT = 3  # item: scenario index, value: score
+LINK_CLICK = 4  # item: link serial, correct: whether the link was legitimate, value: score after the click
+END = 5  # value: final score
+QUIT = 6  # value: score when the window was closed
+KIND_NAMES = {LEVEL: 'level', ANSWER: 'answer', TIMEOUT: 'timeout', LINK_CLICK: 'link_click', END: 'end', QUIT: 'quit'}
+
+FLUSH_INTERVAL = 1.0  # seconds between background flushes
+
+class Telemetry:
+    def __init__(self, capacity=4096):
+        self.enabled = False
+        self.capacity = capacity
+        # Records are packed into a fixed buffer on the frame path; only the flusher thread touches the file
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.head = 0  # records written
+        self.tail = 0  # records flushed
+        self.dropped = 0
+        self.level = 0
+        self.lock = threading.Lock()
+        self.wake = threading.Condition(self.lock)
+        self.write_lock = threading.Lock()
+        self.file = None
+        self.thread = None
+        self.stopping = False
+
+    def start(self, filepath):
+        self.file = open(filepath, 'ab')
+        self.enabled = True
+        self.thread = threading.Thread(target=self.run, name='telemetry-flusher', daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def start_session(self, seed):
+        if not self.enabled:
+            return
+        with self.write_lock:
+            self.write_pending()  # The previous session's records must land before the new header
+            self.file.write(SESSION.pack(SESSION_MAGIC, VERSION, int(time.time() * 1000), seed))
+        self.level = 0
+
+    def set_level(self, number, at):
+        self.level = number
+        self.record(LEVEL, number, at)
+
+    def record(self, kind, item, at, choice=-1, correct=-1, latency=0, value=0):
+        if not self.enabled:
+            return
+        with self.lock:
+            if self.head - self.tail >= self.capacity:
+                self.dropped += 1  # Never block the game on a slow disk
+                return
+            RECORD.pack_into(self.buffer, (self.head % self.capacity) * RECORD.size,
+                             kind, self.level, item, max(0, int(at)), choice, correct, max(0, int(latency)), int(value))
+            self.head += 1
+            if self.head - self.tail >= self.capacity // 2:
+                self.wake.notify()
+
+    def pending(self, start, end):
+        first = (start % self.capacity) * RECORD.size
+        last = (end % self.capacity) * RECORD.size
+        if first < last:
+            return bytes(self.buffer[first:last])
+        return bytes(self.buffer[first:]) + bytes(self.buffer[:last])
+
+    def write_pending(self):
+        # Records between tail and head are never overwritten until tail moves, so they are copied without the lock
+        with self.lock:
+            start, end = self.tail, self.head
+        if start == end:
+            return
+        self.file.write(self.pending(start, end))
+        self.file.flush()
+        with self.lock:
+            self.tail = end
+
+    def run(self):
+        while True:
+            with self.wake:
+                if not self.stopping:
+                    self.wake.wait(FLUSH_INTERVAL)
+                stopping = self.stopping
+            with self.write_lock:
+                self.write_pending()
+            if stopping:
+                return
+
+    def close(self):
+        if not self.enabled:
+            return
+        with self.wake:
+            self.stopping = True
+            self.wake.notify()
+        self.thread.join()
+        self.enabled = False
+        self.file.close()
+        if self.dropped:
+            logger.warning("Telemetry dropped %d records because the buffer was full", self.dropped)
+
+def read_log(filepath):
+    # Yields one dict per record, each tagged with the session it belongs to
+    with open(filepath, 'rb') as log_file:
+        data = log_file.read()
+    offset = 0
+    session = None
+    sessions = 0
+    while offset < len(data):
+        if data[offset:offset + 4] == SESSION_MAGIC:
+            _, version, started, seed = SESSION.unpack_from(data, offset)
+            if version != VERSION:
+                raise ValueError(f"Unsupported telemetry version {version} at byte {offset}")
+            session = {'index': sessions, 'started': started, 'seed': seed}
+            sessions += 1
+            offset += SESSION.size
+            continue
+        if session is None or offset + RECORD.size > len(data):
+            raise ValueError(f"Corrupt telemetry log at byte {offset}")
+        kind, level, item, at, choice, correct, latency, value = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        yield {
+            'session': session['index'],
+            'started': session['started'],
+            'seed': session['seed'],
+            'kind': KIND_NAMES.get(kind, kind),
+            'level': level,
+            'item': item,
+            'at': at,
+            'choice': choice,
+            'correct': None if correct < 0 else bool(correct),
+            'latency': latency,
+            'value': value
+        }
+
+def summarise(filepath):
+    sessions = {}
+    for record in read_log(filepath):
+        session = sessions.setdefault(record['session'], {'started': record['started'], 'answers': 0, 'correct': 0, 'timeouts': 0, 'latency': 0, 'links': 0, 'score': None})
+        if record['kind'] == 'answer':
+            session['answers'] += 1
+            session['correct'] += record['correct']
+            session['latency'] += record['latency']
+        elif record['kind'] == 'timeout':
+            session['timeouts'] += 1
+        elif record['kind'] == 'link_click':
+            session['links'] += 1
+        elif record['kind'] in ('end', 'quit'):
+            session['score'] = record['value']
+    for session in sessions.values():
+        answers = session['answers']
+        mean_latency = session['latency'] / answers if answers else 0
+        print(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(session['started'] / 1000))}  score {session['score']}  "
+              f"answers {session['correct']}/{answers}  timeouts {session['timeouts']}  "
+              f"mean reaction {mean_latency:.0f}ms  link clicks {session['links']}")
+
+# Disabled until start() is called
+telemetry = Telemetry()
+
+if __name__ == "__main__":
+    summarise(sys.argv[1])
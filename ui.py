@@ -1,5 +1,7 @@
 import pygame
 from utils import COLOURS
+from text_cache import text_cache
+from fonts import fonts
 
 class Button:
     def __init__(self, text, x, y, width, height, color=COLOURS['BLACK'], text_color=COLOURS['WHITE']):
@@ -7,12 +9,12 @@ class Button:
         self.color = color
         self.text = text
         self.text_color = text_color
-        self.font = pygame.font.Font(None, 32)
+        self.font = fonts.get(None, 32)
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect)
         pygame.draw.rect(screen, COLOURS['WHITE'], self.rect, 2)  # Change border color to white
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -24,7 +26,7 @@ class TextInput:
         self.rect = pygame.Rect(x, y, width, height)
         self.color = COLOURS['WHITE']
         self.text = ""
-        self.font = pygame.font.Font(None, font_size)
+        self.font = fonts.get(None, font_size)
         self.active = False
 
     def handle_event(self, event):
@@ -64,17 +66,62 @@ class ProgressBar:
         fill_rect = pygame.Rect(self.rect.left, self.rect.top, fill_width, self.rect.height)
         pygame.draw.rect(screen, COLOURS['GREEN'], fill_rect)
 
-def position_text(text, font, max_width):
-        lines = []
-        for line in text.split('\n'):
-            words = line.split()
-            current_line = []
-            for word in words:
-                test_line = current_line + [word]
-                if font.size(' '.join(test_line))[0] <= max_width:
-                    current_line.append(word)
-                else:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-            lines.append(' '.join(current_line))
-        return lines
+class Typewriter:
+    def __init__(self, lines, font, color, x, y, line_height, char_delay=20, line_pause=500):
+        self.lines = lines
+        self.font = font
+        self.color = color
+        self.x = x
+        self.y = y
+        self.line_height = line_height
+        self.char_delay = char_delay  # ms per character
+        self.line_pause = line_pause  # ms between lines
+        self.line_index = 0
+        self.chars_shown = 0
+        self.elapsed = 0
+        self.finished = not lines
+
+    def update(self, screen, dt):
+        # Only the characters revealed since the last frame are rendered; returns their dirty rects
+        dirty = []
+        self.elapsed += dt
+        while not self.finished:
+            line = self.lines[self.line_index]
+            target = min(len(line), int(self.elapsed // self.char_delay))
+            if target > self.chars_shown:
+                dirty.append(self.reveal(screen, line, target))
+                self.chars_shown = target
+            line_duration = len(line) * self.char_delay + self.line_pause
+            if self.elapsed < line_duration:
+                break
+            self.elapsed -= line_duration
+            self.next_line()
+        return dirty
+
+    def skip(self, screen):
+        dirty = []
+        while not self.finished:
+            line = self.lines[self.line_index]
+            if self.chars_shown < len(line):
+                dirty.append(self.reveal(screen, line, len(line)))
+            self.next_line()
+        return dirty
+
+    def redraw(self, screen):
+        # Draws everything revealed so far, for when the screen underneath has been replaced
+        for index in range(min(self.line_index, len(self.lines))):
+            screen.blit(self.font.render(self.lines[index], True, self.color), (self.x, self.y + index * self.line_height))
+        if not self.finished and self.chars_shown:
+            line = self.lines[self.line_index][:self.chars_shown]
+            screen.blit(self.font.render(line, True, self.color), (self.x, self.y + self.line_index * self.line_height))
+
+    def reveal(self, screen, line, end):
+        # Each new chunk starts where the whole line rendered so far ends, so typing, skipping and redraws line up
+        surface = self.font.render(line[self.chars_shown:end], True, self.color)
+        x = self.x + self.font.size(line[:self.chars_shown])[0]
+        return screen.blit(surface, (x, self.y + self.line_index * self.line_height))
+
+    def next_line(self):
+        self.line_index += 1
+        self.chars_shown = 0
+        self.finished = self.line_index >= len(self.lines)
@@ -1,5 +1,8 @@
 import pygame
 import csv
+import logging
+
+logger = logging.getLogger(__name__)
 
 WIDTH, HEIGHT = 1024, 768
 FPS = 60
@@ -20,14 +23,14 @@ def load_image(filename, size=None):
             image = pygame.transform.scale(image, size)
         return image
     except pygame.error:
-        print(f"Unable to load image: {filename}")
+        logger.warning("Unable to load image: %s", filename)
         return pygame.Surface((100, 100))  # Return a blank surface as a fallback
 
 def load_sound(filename):
     try:
         return pygame.mixer.Sound(filename)
     except pygame.error:
-        print(f"Unable to load sound: {filename}")
+        logger.warning("Unable to load sound: %s", filename)
         return None  # Return None as a fallback
 
 def load_links_from_csv(filepath):